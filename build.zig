@@ -78,6 +78,33 @@
         
         const benchmark_test_step = b.step("test:benchmark", "Run benchmark tests");
         benchmark_test_step.dependOn(&run_benchmark_tests.step);
+
+        // MCS style fixer tool
+        const mcs_fix_exe = b.addExecutable(.{
+            .name = "mcs_fix",
+            .root_source_file = b.path("tools/mcs_fix.zig"),
+            .target = target,
+            .optimize = .ReleaseFast,
+        });
+
+        const run_mcs_fix = b.addRunArtifact(mcs_fix_exe);
+        if (b.args) |args| {
+            run_mcs_fix.addArgs(args);
+        }
+
+        const mcs_fix_step = b.step("mcs-fix", "Run the MCS style fixer over the tree");
+        mcs_fix_step.dependOn(&run_mcs_fix.step);
+
+        const mcs_fix_tests = b.addTest(.{
+            .root_source_file = b.path("tools/mcs_fix.zig"),
+            .target = target,
+            .optimize = optimize,
+        });
+
+        const run_mcs_fix_tests = b.addRunArtifact(mcs_fix_tests);
+
+        const mcs_fix_test_step = b.step("test:mcs-fix", "Run MCS fixer tests");
+        mcs_fix_test_step.dependOn(&run_mcs_fix_tests.step);
     }
 
 // ╚════════════════════════════════════════════════════════════════════════════════╝
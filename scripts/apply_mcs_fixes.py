@@ -5,6 +5,18 @@ import re
 import sys
 from pathlib import Path
 
+# Single alternation matching all legacy section headers, compiled once at
+# module scope so one pass over the content replaces every border.
+_SECTION_RE = re.compile(r'// =+\n//  (PACK|INIT|CORE|TEST[^\n]*|TYPES)\n// =+')
+
+# Matches an already-formatted section opening border, capturing the name.
+_SEC_OPEN = re.compile(r'══════════════════════════════════════ (PACK|INIT|CORE|TEST|TYPES) ═')
+
+def _section_border(match):
+    """Format the MCS border for a matched legacy section header."""
+    name = match.group(1).split()[0]
+    return f'// ╔══════════════════════════════════════ {name} ══════════════════════════════════════╗'
+
 def get_mcs_header(filename: str, description: str, path: str) -> str:
     """Generate MCS-compliant file header."""
     return f"""// {filename} — {description}
@@ -44,7 +56,7 @@ def apply_mcs_fixes(file_path: Path) -> None:
     new_header = get_mcs_header(filename, description, rel_path)
     
     # Remove old header (first 5-6 lines with ===)
-    lines = content.split('\n')
+    lines = content.splitlines()
     start_idx = 0
     for i, line in enumerate(lines[:10]):
         if line.strip() and not line.startswith('//'):
@@ -55,80 +67,50 @@ def apply_mcs_fixes(file_path: Path) -> None:
     remaining_content = '\n'.join(lines[start_idx:])
     
     # Fix section borders
-    remaining_content = re.sub(
-        r'// =+\n//  PACK\n// =+',
-        '// ╔══════════════════════════════════════ PACK ══════════════════════════════════════╗',
-        remaining_content
-    )
-    
-    remaining_content = re.sub(
-        r'// =+\n//  INIT\n// =+',
-        '// ╔══════════════════════════════════════ INIT ══════════════════════════════════════╗',
-        remaining_content
-    )
-    
-    remaining_content = re.sub(
-        r'// =+\n//  CORE\n// =+',
-        '// ╔══════════════════════════════════════ CORE ══════════════════════════════════════╗',
-        remaining_content
-    )
-    
-    remaining_content = re.sub(
-        r'// =+\n//  TEST.*?\n// =+',
-        '// ╔══════════════════════════════════════ TEST ══════════════════════════════════════╗',
-        remaining_content
-    )
-    
-    remaining_content = re.sub(
-        r'// =+\n//  TYPES\n// =+',
-        '// ╔══════════════════════════════════════ TYPES ══════════════════════════════════════╗',
-        remaining_content
-    )
+    remaining_content = _SECTION_RE.sub(_section_border, remaining_content)
     
     # Add section closers before next section or at end
-    sections = ['PACK', 'INIT', 'CORE', 'TEST', 'TYPES']
-    lines = remaining_content.split('\n')
+    lines = remaining_content.splitlines()
     new_lines = []
     in_section = None
-    
+
     for i, line in enumerate(lines):
         # Check if we're starting a new section
-        for section in sections:
-            if f'══════════════════════════════════════ {section} ═══' in line:
-                # Close previous section if exists
-                if in_section and i > 0:
-                    new_lines.append('')
-                    new_lines.append('// ╚══════════════════════════════════════════════════════════════════════════════════════════╝')
-                    new_lines.append('')
-                in_section = section
-                break
-        
+        sec_match = _SEC_OPEN.search(line)
+        if sec_match:
+            # Close previous section if exists
+            if in_section and i > 0:
+                new_lines.append('')
+                new_lines.append('// ╚══════════════════════════════════════════════════════════════════════════════════════════╝')
+                new_lines.append('')
+            in_section = sec_match.group(1)
+
+        # Scan the line once and reuse the result for every check below
+        lstripped = line.lstrip()
+        if lstripped.startswith('test "'):
+            # Ensure test declarations are indented
+            new_lines.append('    ' + lstripped)
+            continue
+
         new_lines.append(line)
-        
+
         # Add indentation to content within sections
-        if in_section and not line.startswith('//') and line.strip():
+        if in_section and lstripped and line[:2] != '//':
             # This line should be indented
-            if not line.startswith('    ') and not line.startswith('test '):
+            if line[:4] != '    ' and line[:5] != 'test ':
                 # Add 4-space indent
-                new_lines[-1] = '    ' + line.lstrip()
-    
+                new_lines[-1] = '    ' + lstripped
+
     # Close last section
     if in_section:
         new_lines.append('')
         new_lines.append('// ╚══════════════════════════════════════════════════════════════════════════════════════════╝')
-    
-    # Fix test indentation specifically
-    final_lines = []
-    for line in new_lines:
-        if line.strip().startswith('test "'):
-            # Ensure test declarations are indented
-            final_lines.append('    ' + line.lstrip())
-        else:
-            final_lines.append(line)
-    
-    # Combine header with fixed content
-    final_content = new_header + '\n\n' + '\n'.join(final_lines)
-    
+
+    # Combine with the header
+    final_content = new_header + '\n\n' + '\n'.join(new_lines)
+    if content.endswith('\n') and not final_content.endswith('\n'):
+        final_content += '\n'
+
     # Write back
     file_path.write_text(final_content)
     print(f"Fixed: {file_path}")
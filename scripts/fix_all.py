@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Run all MCS fixers over the tree with one read and one write per file."""
+
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+from fix_mcs_borders import fix_borders_lines
+from fix_repo_urls import fix_urls_lines
+from fix_test_braces import fix_test_braces
+from fix_test_names import fix_test_names
+
+_CACHE_NAME = '.mcs_all_cache.json'
+
+# Number of file reads kept in flight ahead of the transforms.
+_READ_AHEAD = 16
+
+def read_file(filepath):
+    """Read a file's bytes; runs on the prefetch thread pool."""
+    with open(filepath, 'rb') as f:
+        return f.read()
+
+def transform(content):
+    """Apply every fixer to in-memory content, returning (fixed, modified).
+
+    Splits once, pipelines the line-level fixers, then rejoins once for the
+    whole-content MULTILINE fixers — one split/join cycle instead of four.
+    """
+    lines = content.split(b'\n')
+    lines, m_borders = fix_borders_lines(lines)
+    lines, m_urls = fix_urls_lines(lines)
+    fixed = b'\n'.join(lines)
+    fixed, m_names = fix_test_names(fixed)
+    fixed, m_braces = fix_test_braces(fixed)
+    return fixed, m_borders or m_urls or m_braces or m_names
+
+def iter_zig(root):
+    """Yield the path of every .zig file under root, skipping build directories."""
+    stack = [root]
+    while stack:
+        for entry in os.scandir(stack.pop()):
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in ('.zig-cache', 'zig-out'):
+                    stack.append(entry.path)
+            elif entry.name.endswith('.zig'):
+                yield entry.path
+
+def load_cache(cache_path):
+    """Load the mtime/size skip cache, returning an empty dict on any failure."""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(cache_path, cache):
+    """Persist the mtime/size skip cache, ignoring write failures."""
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+def main():
+    """Main function to process all .zig files."""
+    project_root = Path("/home/fisty/code/zig-nfl-clock")
+
+    # Find all .zig files
+    zig_files = list(iter_zig(project_root))
+
+    print(f"Found {len(zig_files)} .zig files to process\n")
+
+    # Skip files whose mtime/size still match a previous run that left them
+    # unchanged; --no-cache (e.g. in CI) disables the sidecar entirely.
+    use_cache = '--no-cache' not in sys.argv
+    cache_path = os.path.join(project_root, _CACHE_NAME)
+    cache = load_cache(cache_path) if use_cache else {}
+
+    to_process = []
+    stats = {}
+    for filepath in sorted(zig_files):
+        st = os.stat(filepath)
+        stats[filepath] = [st.st_mtime_ns, st.st_size]
+        if cache.get(filepath) != stats[filepath]:
+            to_process.append(filepath)
+
+    if len(to_process) < len(zig_files):
+        print(f"Skipping {len(zig_files) - len(to_process)} unchanged files (cached)\n")
+
+    # Overlap file I/O with the CPU-bound fixing: a small thread pool keeps a
+    # window of reads in flight while the transforms fan out across cores,
+    # and the main thread writes each file back as its transform completes.
+    # Both windows are capped at _READ_AHEAD so at most a window's worth of
+    # file contents is held in memory at once.
+    results = []
+    with ProcessPoolExecutor() as workers, ThreadPoolExecutor(max_workers=4) as readers:
+        pending_reads = deque()
+        pending_transforms = deque()
+        next_file = 0
+        submitted = 0
+        while next_file < len(to_process) and len(pending_reads) < _READ_AHEAD:
+            pending_reads.append(readers.submit(read_file, to_process[next_file]))
+            next_file += 1
+
+        while pending_reads or pending_transforms:
+            # Feed the transform window from completed reads, topping up the
+            # read window behind it
+            while pending_reads and len(pending_transforms) < _READ_AHEAD:
+                read_future = pending_reads.popleft()
+                filepath = to_process[submitted]
+                submitted += 1
+                try:
+                    pending_transforms.append(
+                        (filepath, workers.submit(transform, read_future.result())))
+                except OSError as e:
+                    pending_transforms.append((filepath, e))
+                if next_file < len(to_process):
+                    pending_reads.append(readers.submit(read_file, to_process[next_file]))
+                    next_file += 1
+
+            # Drain the oldest transform, writing the file back in order
+            filepath, item = pending_transforms.popleft()
+            if isinstance(item, Exception):
+                print(f"✗ Error processing {filepath}: {item}")
+                results.append(None)
+                continue
+            try:
+                fixed, modified = item.result()
+                if modified:
+                    with open(filepath, 'wb') as f:
+                        f.write(fixed)
+                    print(f"✓ Fixed: {filepath}")
+                else:
+                    print(f"  No changes needed: {filepath}")
+                results.append(modified)
+            except Exception as e:
+                print(f"✗ Error processing {filepath}: {e}")
+                results.append(None)
+    modified_count = sum(1 for r in results if r)
+
+    if use_cache:
+        for filepath, was_modified in zip(to_process, results):
+            if was_modified:
+                cache.pop(filepath, None)
+            elif was_modified is False:
+                # None means the file errored; leave it uncached so the
+                # next run retries it
+                cache[filepath] = stats[filepath]
+        save_cache(cache_path, cache)
+
+    print(f"\n{'='*50}")
+    print(f"Summary: Fixed {modified_count}/{len(zig_files)} files")
+
+if __name__ == "__main__":
+    main()
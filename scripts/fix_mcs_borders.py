@@ -1,83 +1,157 @@
 #!/usr/bin/env python3
 """Fix MCS section borders to be exactly 88 characters wide."""
 
+import io
+import json
 import os
+from concurrent.futures import ProcessPoolExecutor
 import re
 import sys
-from pathlib import Path
 
-def fix_section_borders(content):
-    """Fix all section borders to be exactly 88 characters wide."""
-    lines = content.split('\n')
-    modified = False
-    
-    for i, line in enumerate(lines):
-        # Match main section borders
-        if re.match(r'^// ╔═+\s+\w+\s+═+╗\s*$', line):
-            # Extract the section name
-            match = re.search(r'═+\s+(\w+)\s+═+', line)
-            if match:
-                section_name = match.group(1)
-                # Calculate padding needed
-                base_len = len("// ╔") + len(section_name) + len("╗") + 2  # 2 spaces around name
-                padding_total = 88 - base_len
-                padding_each = padding_total // 2
-                
-                # Create new border with exact width
-                new_line = f"// ╔{'═' * padding_each} {section_name} {'═' * (padding_total - padding_each)}╗"
-                if len(new_line) != 88:
-                    # Adjust if needed due to odd number
-                    diff = 88 - len(new_line)
-                    new_line = f"// ╔{'═' * (padding_each + diff)} {section_name} {'═' * (padding_total - padding_each)}╗"
-                
-                if line != new_line:
-                    lines[i] = new_line
-                    modified = True
-        
-        # Match closing borders
-        elif re.match(r'^// ╚═+╝\s*$', line):
-            new_line = f"// ╚{'═' * 84}╝"
+_CACHE_NAME = '.mcs_borders_cache.json'
+
+def _make_border(corner_l, fill, name, corner_r):
+    """Build an 88-character border line for a section name."""
+    base_len = len("// ") + 1 + len(name) + 1 + 2  # corners plus 2 spaces around name
+    padding_total = 88 - base_len
+    padding_each = padding_total // 2
+
+    new_line = f"// {corner_l}{fill * padding_each} {name} {fill * (padding_total - padding_each)}{corner_r}"
+    if len(new_line) != 88:
+        # Adjust if needed due to odd number
+        diff = 88 - len(new_line)
+        new_line = f"// {corner_l}{fill * (padding_each + diff)} {name} {fill * (padding_total - padding_each)}{corner_r}"
+
+    return new_line
+
+# Border lines depend only on the section name, so memoize them instead of
+# rebuilding the padding strings for every matched line. The standard section
+# names are precomputed; subsection names are cached on first use. Everything
+# is kept as UTF-8 bytes so files avoid a decode/encode round-trip.
+_OPEN_BORDERS = {name.encode('utf-8'): _make_border('╔', '═', name, '╗').encode('utf-8')
+                 for name in ('PACK', 'INIT', 'CORE', 'TEST', 'TYPES')}
+_SUB_OPEN_BORDERS = {}
+_CLOSE_BORDER = ("// ╚" + "═" * 84 + "╝").encode('utf-8')
+_SUB_CLOSE_BORDER = ("// └" + "─" * 84 + "┘").encode('utf-8')
+
+# The box-drawing literals are non-ASCII, so the patterns are encoded once
+# here rather than written as rb'' literals. Each repeated box character is
+# wrapped in (?:...) so the quantifier covers the whole multi-byte sequence.
+_MAIN_OPEN_RE = re.compile(r'^// ╔(?:═)+\s+\w+\s+(?:═)+╗\s*$'.encode('utf-8'))
+_MAIN_NAME_RE = re.compile(r'(?:═)+\s+(\w+)\s+(?:═)+'.encode('utf-8'))
+_MAIN_CLOSE_RE = re.compile(r'^// ╚(?:═)+╝\s*$'.encode('utf-8'))
+_SUB_OPEN_RE = re.compile(r'^// ┌(?:─)+\s+\w+\s+(?:─)+┐\s*$'.encode('utf-8'))
+_SUB_NAME_RE = re.compile(r'(?:─)+\s+(\w+)\s+(?:─)+'.encode('utf-8'))
+_SUB_CLOSE_RE = re.compile(r'^// └(?:─)+┘\s*$'.encode('utf-8'))
+
+_PROBES = tuple(c.encode('utf-8') for c in ('╔', '╚', '┌', '└'))
+
+def _open_border(section_name):
+    """Return the cached 88-character opening border for a section."""
+    line = _OPEN_BORDERS.get(section_name)
+    if line is None:
+        name = section_name.decode('utf-8')
+        line = _OPEN_BORDERS[section_name] = _make_border('╔', '═', name, '╗').encode('utf-8')
+    return line
+
+def _sub_open_border(section_name):
+    """Return the cached 88-character opening border for a subsection."""
+    line = _SUB_OPEN_BORDERS.get(section_name)
+    if line is None:
+        name = section_name.decode('utf-8')
+        line = _SUB_OPEN_BORDERS[section_name] = _make_border('┌', '─', name, '┐').encode('utf-8')
+    return line
+
+def _fix_border_line(line):
+    """Return the corrected border for a single line, or None if unchanged."""
+    # Match main section borders
+    if _MAIN_OPEN_RE.match(line):
+        # Extract the section name
+        match = _MAIN_NAME_RE.search(line)
+        if match:
+            new_line = _open_border(match.group(1))
             if line != new_line:
-                lines[i] = new_line
-                modified = True
-        
-        # Match subsection borders (opening)
-        elif re.match(r'^// ┌─+\s+\w+\s+─+┐\s*$', line):
-            match = re.search(r'─+\s+(\w+)\s+─+', line)
-            if match:
-                section_name = match.group(1)
-                base_len = len("// ┌") + len(section_name) + len("┐") + 2
-                padding_total = 88 - base_len
-                padding_each = padding_total // 2
-                
-                new_line = f"// ┌{'─' * padding_each} {section_name} {'─' * (padding_total - padding_each)}┐"
-                if len(new_line) != 88:
-                    diff = 88 - len(new_line)
-                    new_line = f"// ┌{'─' * (padding_each + diff)} {section_name} {'─' * (padding_total - padding_each)}┐"
-                
-                if line != new_line:
-                    lines[i] = new_line
-                    modified = True
-        
-        # Match subsection borders (closing)
-        elif re.match(r'^// └─+┘\s*$', line):
-            new_line = f"// └{'─' * 84}┘"
+                return new_line
+
+    # Match closing borders
+    elif _MAIN_CLOSE_RE.match(line):
+        if line != _CLOSE_BORDER:
+            return _CLOSE_BORDER
+
+    # Match subsection borders (opening)
+    elif _SUB_OPEN_RE.match(line):
+        match = _SUB_NAME_RE.search(line)
+        if match:
+            new_line = _sub_open_border(match.group(1))
             if line != new_line:
-                lines[i] = new_line
+                return new_line
+
+    # Match subsection borders (closing)
+    elif _SUB_CLOSE_RE.match(line):
+        if line != _SUB_CLOSE_BORDER:
+            return _SUB_CLOSE_BORDER
+
+    return None
+
+def fix_borders_lines(lines):
+    """Fix section borders on an already-split list of byte lines."""
+    modified = False
+
+    for i, line in enumerate(lines):
+        new_line = _fix_border_line(line)
+        if new_line is not None:
+            lines[i] = new_line
+            modified = True
+
+    return lines, modified
+
+# Above this size, stream the result through a BytesIO instead of holding the
+# full line list and the joined copy at the same time.
+_STREAM_THRESHOLD = 256 * 1024
+
+def fix_section_borders(content):
+    """Fix all section borders to be exactly 88 characters wide."""
+    # Fast reject: nothing to do for files without any box-drawing borders
+    if not any(probe in content for probe in _PROBES):
+        return content, False
+
+    if len(content) > _STREAM_THRESHOLD:
+        buf = io.BytesIO()
+        modified = False
+        for raw in io.BytesIO(content):
+            line = raw[:-1] if raw.endswith(b'\n') else raw
+            new_line = _fix_border_line(line)
+            if new_line is None:
+                buf.write(raw)
+            else:
                 modified = True
-    
-    return '\n'.join(lines), modified
+                buf.write(new_line)
+                if raw.endswith(b'\n'):
+                    buf.write(b'\n')
+        if not modified:
+            return content, False
+        return buf.getvalue(), True
+
+    lines, modified = fix_borders_lines(content.splitlines())
+    if not modified:
+        # Skip the rejoin when nothing changed — the common case
+        return content, False
+
+    fixed = b'\n'.join(lines)
+    if content.endswith(b'\n'):
+        fixed += b'\n'
+    return fixed, modified
 
 def process_file(filepath):
     """Process a single .zig file."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
+        with open(filepath, 'rb') as f:
             content = f.read()
-        
+
         fixed_content, modified = fix_section_borders(content)
-        
+
         if modified:
-            with open(filepath, 'w', encoding='utf-8') as f:
+            with open(filepath, 'wb') as f:
                 f.write(fixed_content)
             print(f"✓ Fixed borders in: {filepath}")
             return True
@@ -86,28 +160,76 @@ def process_file(filepath):
             return False
     except Exception as e:
         print(f"✗ Error processing {filepath}: {e}")
-        return False
+        return None
+
+def iter_zig(root):
+    """Yield the path of every .zig file under root, skipping build directories."""
+    stack = [root]
+    while stack:
+        for entry in os.scandir(stack.pop()):
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in ('.zig-cache', 'zig-out'):
+                    stack.append(entry.path)
+            elif entry.name.endswith('.zig'):
+                yield entry.path
+
+def load_cache(cache_path):
+    """Load the mtime/size skip cache, returning an empty dict on any failure."""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(cache_path, cache):
+    """Persist the mtime/size skip cache, ignoring write failures."""
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
 
 def main():
     """Main function to process all .zig files."""
-    project_root = Path("/home/fisty/code/zig-nfl-clock")
-    zig_files = []
+    # Plain strings end-to-end; path-object churn adds up in tight loops
+    project_root = '/home/fisty/code/zig-nfl-clock'
     
     # Find all .zig files
-    for root, dirs, files in os.walk(project_root):
-        # Skip build directories
-        if '.zig-cache' in root or 'zig-out' in root:
-            continue
-        for file in files:
-            if file.endswith('.zig'):
-                zig_files.append(os.path.join(root, file))
+    zig_files = list(iter_zig(project_root))
     
     print(f"Found {len(zig_files)} .zig files to process\n")
     
-    modified_count = 0
+    # Skip files whose mtime/size still match a previous run that left them
+    # unchanged; --no-cache (e.g. in CI) disables the sidecar entirely.
+    use_cache = '--no-cache' not in sys.argv
+    cache_path = os.path.join(project_root, _CACHE_NAME)
+    cache = load_cache(cache_path) if use_cache else {}
+    
+    to_process = []
+    stats = {}
     for filepath in sorted(zig_files):
-        if process_file(filepath):
-            modified_count += 1
+        st = os.stat(filepath)
+        stats[filepath] = [st.st_mtime_ns, st.st_size]
+        if cache.get(filepath) != stats[filepath]:
+            to_process.append(filepath)
+    
+    if len(to_process) < len(zig_files):
+        print(f"Skipping {len(zig_files) - len(to_process)} unchanged files (cached)\n")
+    
+    # File-level work is independent, so fan it out across cores
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(process_file, to_process, chunksize=8))
+    modified_count = sum(1 for r in results if r)
+    
+    if use_cache:
+        for filepath, was_modified in zip(to_process, results):
+            if was_modified:
+                cache.pop(filepath, None)
+            elif was_modified is False:
+                # None means the file errored; leave it uncached so the
+                # next run retries it
+                cache[filepath] = stats[filepath]
+        save_cache(cache_path, cache)
     
     print(f"\n{'='*50}")
     print(f"Summary: Fixed {modified_count}/{len(zig_files)} files")
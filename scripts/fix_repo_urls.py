@@ -1,52 +1,76 @@
 #!/usr/bin/env python3
 """Fix repository URLs in file headers to match actual project location."""
 
+import json
 import os
-import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-def fix_repo_urls(content):
-    """Fix repository URLs in file headers."""
-    lines = content.split('\n')
+_CACHE_NAME = '.mcs_urls_cache.json'
+
+_REPO_PREFIX = b'// repo   : '
+_REPO_LINE = b'// repo   : https://github.com/fisty/zig-nfl-clock'
+_DOCS_PREFIX = b'// docs   : https://'
+_DOCS_NEW_PREFIX = b'// docs   : https://fisty.github.io/zig-nfl-clock/'
+
+def fix_urls_lines(lines):
+    """Fix repository URLs on an already-split list of byte lines."""
     modified = False
-    
+
     for i, line in enumerate(lines):
         # Fix repo URL
-        if line.startswith('// repo   : '):
-            new_line = '// repo   : https://github.com/fisty/zig-nfl-clock'
-            if line != new_line:
-                lines[i] = new_line
+        if line.startswith(_REPO_PREFIX):
+            if line != _REPO_LINE:
+                lines[i] = _REPO_LINE
                 modified = True
-        
+
         # Fix docs URL
-        elif line.startswith('// docs   : '):
-            # Extract the path part after the domain
-            match = re.search(r'// docs   : https://[^/]+/(.*)', line)
-            if match:
-                path = match.group(1)
+        elif line.startswith(_DOCS_PREFIX):
+            # Already canonical — rewriting would prepend the project path
+            # segment again on every run
+            if line.startswith(_DOCS_NEW_PREFIX):
+                continue
+            # Extract the path part after the domain (fixed-prefix string ops
+            # beat a regex here)
+            slash = line.find(b'/', len(_DOCS_PREFIX))
+            if slash != -1:
                 # Update to use correct domain
-                new_line = f'// docs   : https://fisty.github.io/zig-nfl-clock/{path}'
+                new_line = _DOCS_NEW_PREFIX + line[slash + 1:]
                 if line != new_line:
                     lines[i] = new_line
                     modified = True
-        
+
         # Fix author URL if needed
-        elif line.startswith('// author : '):
+        elif line.startswith(b'// author : '):
             # Keep existing author URLs as they are
             pass
-    
-    return '\n'.join(lines), modified
+
+    return lines, modified
+
+def fix_repo_urls(content):
+    """Fix repository URLs in file headers.
+
+    Operates on bytes so files avoid a decode/encode round-trip.
+    """
+    # Fast reject: nothing to do for files without header URL lines
+    if b'// repo' not in content and b'// docs' not in content:
+        return content, False
+
+    lines, modified = fix_urls_lines(content.split(b'\n'))
+    # Skip the rejoin when nothing changed — the common case
+    return (b'\n'.join(lines) if modified else content), modified
 
 def process_file(filepath):
     """Process a single .zig file."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
+        with open(filepath, 'rb') as f:
             content = f.read()
-        
+
         fixed_content, modified = fix_repo_urls(content)
-        
+
         if modified:
-            with open(filepath, 'w', encoding='utf-8') as f:
+            with open(filepath, 'wb') as f:
                 f.write(fixed_content)
             print(f"✓ Fixed URLs in: {filepath}")
             return True
@@ -55,28 +79,75 @@ def process_file(filepath):
             return False
     except Exception as e:
         print(f"✗ Error processing {filepath}: {e}")
-        return False
+        return None
+
+def iter_zig(root):
+    """Yield the path of every .zig file under root, skipping build directories."""
+    stack = [root]
+    while stack:
+        for entry in os.scandir(stack.pop()):
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in ('.zig-cache', 'zig-out'):
+                    stack.append(entry.path)
+            elif entry.name.endswith('.zig'):
+                yield entry.path
+
+def load_cache(cache_path):
+    """Load the mtime/size skip cache, returning an empty dict on any failure."""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(cache_path, cache):
+    """Persist the mtime/size skip cache, ignoring write failures."""
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
 
 def main():
     """Main function to process all .zig files."""
     project_root = Path("/home/fisty/code/zig-nfl-clock")
-    zig_files = []
     
     # Find all .zig files
-    for root, dirs, files in os.walk(project_root):
-        # Skip build directories
-        if '.zig-cache' in root or 'zig-out' in root:
-            continue
-        for file in files:
-            if file.endswith('.zig'):
-                zig_files.append(os.path.join(root, file))
+    zig_files = list(iter_zig(project_root))
     
     print(f"Found {len(zig_files)} .zig files to process\n")
     
-    modified_count = 0
+    # Skip files whose mtime/size still match a previous run that left them
+    # unchanged; --no-cache (e.g. in CI) disables the sidecar entirely.
+    use_cache = '--no-cache' not in sys.argv
+    cache_path = os.path.join(project_root, _CACHE_NAME)
+    cache = load_cache(cache_path) if use_cache else {}
+    
+    to_process = []
+    stats = {}
     for filepath in sorted(zig_files):
-        if process_file(filepath):
-            modified_count += 1
+        st = os.stat(filepath)
+        stats[filepath] = [st.st_mtime_ns, st.st_size]
+        if cache.get(filepath) != stats[filepath]:
+            to_process.append(filepath)
+    
+    if len(to_process) < len(zig_files):
+        print(f"Skipping {len(zig_files) - len(to_process)} unchanged files (cached)\n")
+    
+    # File-level work is independent, so fan it out across cores
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(process_file, to_process, chunksize=8))
+    modified_count = sum(1 for r in results if r)
+    
+    if use_cache:
+        for filepath, was_modified in zip(to_process, results):
+            if was_modified:
+                cache.pop(filepath, None)
+            elif was_modified is False:
+                # None means the file errored; leave it uncached so the
+                # next run retries it
+                cache[filepath] = stats[filepath]
+        save_cache(cache_path, cache)
     
     print(f"\n{'='*50}")
     print(f"Summary: Fixed URLs in {modified_count}/{len(zig_files)} files")
@@ -1,35 +1,39 @@
 #!/usr/bin/env python3
 """Fix missing opening braces in test declarations."""
 
+import json
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 import re
 from pathlib import Path
 
+_CACHE_NAME = '.mcs_braces_cache.json'
+
+# Anchored per-line via MULTILINE so the whole content is scanned in one
+# regex pass instead of a Python-level loop invoking the engine per line.
+# All whitespace classes are [ \t] rather than \s so a match never crosses
+# a line boundary.
+_TEST_BRACE_RE = re.compile(rb'^([ \t]*test[ \t]+"[^\n"]+")[ \t]*$', re.MULTILINE)
+
 def fix_test_braces(content):
-    """Fix test declarations missing opening braces."""
-    lines = content.split('\n')
-    modified = False
-    
-    for i, line in enumerate(lines):
-        # Match test declaration without opening brace
-        if re.match(r'^(\s*)test\s+"[^"]+"\s*$', line):
-            # Add opening brace
-            lines[i] = line + ' {'
-            modified = True
-            print(f"  Fixed test declaration: {line.strip()}")
-    
-    return '\n'.join(lines), modified
+    """Fix test declarations missing opening braces.
+
+    Operates on bytes so files avoid a decode/encode round-trip.
+    """
+    new_content, count = _TEST_BRACE_RE.subn(rb'\1 {', content)
+    return new_content, count > 0
 
 def process_file(filepath):
     """Process a single .zig file."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
+        with open(filepath, 'rb') as f:
             content = f.read()
-        
+
         fixed_content, modified = fix_test_braces(content)
-        
+
         if modified:
-            with open(filepath, 'w', encoding='utf-8') as f:
+            with open(filepath, 'wb') as f:
                 f.write(fixed_content)
             print(f"✓ Fixed test braces in: {filepath}")
             return True
@@ -38,28 +42,75 @@ def process_file(filepath):
             return False
     except Exception as e:
         print(f"✗ Error processing {filepath}: {e}")
-        return False
+        return None
+
+def iter_zig(root):
+    """Yield the path of every .zig file under root, skipping build directories."""
+    stack = [root]
+    while stack:
+        for entry in os.scandir(stack.pop()):
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in ('.zig-cache', 'zig-out'):
+                    stack.append(entry.path)
+            elif entry.name.endswith('.zig'):
+                yield entry.path
+
+def load_cache(cache_path):
+    """Load the mtime/size skip cache, returning an empty dict on any failure."""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(cache_path, cache):
+    """Persist the mtime/size skip cache, ignoring write failures."""
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
 
 def main():
     """Main function to process all .zig files."""
     project_root = Path("/home/fisty/code/zig-nfl-clock")
-    zig_files = []
     
     # Find all .zig files
-    for root, dirs, files in os.walk(project_root):
-        # Skip build directories
-        if '.zig-cache' in root or 'zig-out' in root:
-            continue
-        for file in files:
-            if file.endswith('.zig'):
-                zig_files.append(os.path.join(root, file))
+    zig_files = list(iter_zig(project_root))
     
     print(f"Found {len(zig_files)} .zig files to process\n")
     
-    modified_count = 0
+    # Skip files whose mtime/size still match a previous run that left them
+    # unchanged; --no-cache (e.g. in CI) disables the sidecar entirely.
+    use_cache = '--no-cache' not in sys.argv
+    cache_path = os.path.join(project_root, _CACHE_NAME)
+    cache = load_cache(cache_path) if use_cache else {}
+    
+    to_process = []
+    stats = {}
     for filepath in sorted(zig_files):
-        if process_file(filepath):
-            modified_count += 1
+        st = os.stat(filepath)
+        stats[filepath] = [st.st_mtime_ns, st.st_size]
+        if cache.get(filepath) != stats[filepath]:
+            to_process.append(filepath)
+    
+    if len(to_process) < len(zig_files):
+        print(f"Skipping {len(zig_files) - len(to_process)} unchanged files (cached)\n")
+    
+    # File-level work is independent, so fan it out across cores
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(process_file, to_process, chunksize=8))
+    modified_count = sum(1 for r in results if r)
+    
+    if use_cache:
+        for filepath, was_modified in zip(to_process, results):
+            if was_modified:
+                cache.pop(filepath, None)
+            elif was_modified is False:
+                # None means the file errored; leave it uncached so the
+                # next run retries it
+                cache[filepath] = stats[filepath]
+        save_cache(cache_path, cache)
     
     print(f"\n{'='*50}")
     print(f"Summary: Fixed test braces in {modified_count}/{len(zig_files)} files")
@@ -1,59 +1,76 @@
 #!/usr/bin/env python3
 """Fix test naming to use PascalCase for components as per MCS guidelines."""
 
+import json
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 import re
 from pathlib import Path
+from types import MappingProxyType
+
+_CACHE_NAME = '.mcs_names_cache.json'
+
+# Special cases for compound words, built once and frozen at module scope.
+_SPECIAL_CASES = MappingProxyType({
+    'game_clock': 'GameClock',
+    'time_formatter': 'TimeFormatter',
+    'rules_engine': 'RulesEngine',
+    'play_handler': 'PlayHandler',
+    'config': 'Config',
+})
 
 def pascalize(snake_case):
     """Convert snake_case to PascalCase."""
-    # Special cases for compound words
-    special_cases = {
-        'game_clock': 'GameClock',
-        'time_formatter': 'TimeFormatter',
-        'rules_engine': 'RulesEngine',
-        'play_handler': 'PlayHandler',
-        'config': 'Config',
-    }
-    
-    if snake_case in special_cases:
-        return special_cases[snake_case]
-    
-    # General conversion
-    parts = snake_case.split('_')
-    return ''.join(part.capitalize() for part in parts)
+    special = _SPECIAL_CASES.get(snake_case)
+    if special is not None:
+        return special
+
+    # General conversion; upper-casing just the first character skips the
+    # tail recasing that str.capitalize would do on each part.
+    return ''.join([part[:1].upper() + part[1:] for part in snake_case.split('_')])
+
+# Matches test declarations with category, component, and description:
+# test "category: component_name: description". Anchored per-line via
+# MULTILINE so the whole content is scanned in one regex pass; all
+# whitespace classes are [ \t] and the category class excludes newlines so
+# a match never crosses a line boundary.
+_TEST_NAME_RE = re.compile(rb'^([ \t]*)test[ \t]+"([^:\n]+):[ \t]+([a-z_]+):[ \t]+(.+)"', re.MULTILINE)
+
+def _pascalize_decl(match):
+    """Rewrite a matched test declaration with a PascalCase component."""
+    indent, category, component, description = match.groups()
+    pascal_component = pascalize(component.decode('utf-8')).encode('utf-8')
+    if pascal_component == component:
+        return match.group(0)
+
+    print(f"  Fixed test: {component.decode('utf-8')} → {pascal_component.decode('utf-8')}")
+    return (indent + b'test "' + category + b': '
+            + pascal_component + b': ' + description + b'"')
 
 def fix_test_names(content):
-    """Fix test naming conventions in content."""
-    lines = content.split('\n')
-    modified = False
-    
-    for i, line in enumerate(lines):
-        # Match test declarations with category, component, and description
-        # Pattern: test "category: component_name: description"
-        match = re.match(r'^(\s*)test\s+"([^:]+):\s+([a-z_]+):\s+(.+)"', line)
-        if match:
-            indent, category, component, description = match.groups()
-            # Convert component to PascalCase
-            pascal_component = pascalize(component)
-            if pascal_component != component:
-                new_line = f'{indent}test "{category}: {pascal_component}: {description}"'
-                lines[i] = new_line
-                modified = True
-                print(f"  Fixed test: {component} → {pascal_component}")
-    
-    return '\n'.join(lines), modified
+    """Fix test naming conventions in content.
+
+    Operates on bytes so files avoid a decode/encode round-trip; only the
+    matched component is decoded for the PascalCase conversion.
+    """
+    # Fast reject: nothing to do for files without test declarations
+    if b'test "' not in content:
+        return content, False
+
+    new_content = _TEST_NAME_RE.sub(_pascalize_decl, content)
+    return new_content, new_content != content
 
 def process_file(filepath):
     """Process a single .zig file."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
+        with open(filepath, 'rb') as f:
             content = f.read()
-        
+
         fixed_content, modified = fix_test_names(content)
-        
+
         if modified:
-            with open(filepath, 'w', encoding='utf-8') as f:
+            with open(filepath, 'wb') as f:
                 f.write(fixed_content)
             print(f"✓ Fixed test names in: {filepath}")
             return True
@@ -62,28 +79,75 @@ def process_file(filepath):
             return False
     except Exception as e:
         print(f"✗ Error processing {filepath}: {e}")
-        return False
+        return None
+
+def iter_zig(root):
+    """Yield the path of every .zig file under root, skipping build directories."""
+    stack = [root]
+    while stack:
+        for entry in os.scandir(stack.pop()):
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in ('.zig-cache', 'zig-out'):
+                    stack.append(entry.path)
+            elif entry.name.endswith('.zig'):
+                yield entry.path
+
+def load_cache(cache_path):
+    """Load the mtime/size skip cache, returning an empty dict on any failure."""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(cache_path, cache):
+    """Persist the mtime/size skip cache, ignoring write failures."""
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
 
 def main():
     """Main function to process all .zig files."""
     project_root = Path("/home/fisty/code/zig-nfl-clock")
-    zig_files = []
     
     # Find all .zig files
-    for root, dirs, files in os.walk(project_root):
-        # Skip build directories
-        if '.zig-cache' in root or 'zig-out' in root:
-            continue
-        for file in files:
-            if file.endswith('.zig'):
-                zig_files.append(os.path.join(root, file))
+    zig_files = list(iter_zig(project_root))
     
     print(f"Found {len(zig_files)} .zig files to process\n")
     
-    modified_count = 0
+    # Skip files whose mtime/size still match a previous run that left them
+    # unchanged; --no-cache (e.g. in CI) disables the sidecar entirely.
+    use_cache = '--no-cache' not in sys.argv
+    cache_path = os.path.join(project_root, _CACHE_NAME)
+    cache = load_cache(cache_path) if use_cache else {}
+    
+    to_process = []
+    stats = {}
     for filepath in sorted(zig_files):
-        if process_file(filepath):
-            modified_count += 1
+        st = os.stat(filepath)
+        stats[filepath] = [st.st_mtime_ns, st.st_size]
+        if cache.get(filepath) != stats[filepath]:
+            to_process.append(filepath)
+    
+    if len(to_process) < len(zig_files):
+        print(f"Skipping {len(zig_files) - len(to_process)} unchanged files (cached)\n")
+    
+    # File-level work is independent, so fan it out across cores
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(process_file, to_process, chunksize=8))
+    modified_count = sum(1 for r in results if r)
+    
+    if use_cache:
+        for filepath, was_modified in zip(to_process, results):
+            if was_modified:
+                cache.pop(filepath, None)
+            elif was_modified is False:
+                # None means the file errored; leave it uncached so the
+                # next run retries it
+                cache[filepath] = stats[filepath]
+        save_cache(cache_path, cache)
     
     print(f"\n{'='*50}")
     print(f"Summary: Fixed test names in {modified_count}/{len(zig_files)} files")
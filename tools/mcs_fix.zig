@@ -0,0 +1,406 @@
+// mcs_fix.zig — Native MCS style fixer replacing the Python fixer scripts
+//
+// repo   : https://github.com/fisty/zig-nfl-clock
+// docs   : https://fisty.github.io/zig-nfl-clock/docs/tools/mcs_fix
+// author : https://github.com/scoomboot
+//
+// Vibe coded by Scoom.
+
+// ╔══════════════════════════════════════ PACK ═══════════════════════════════════════╗
+
+    const std = @import("std");
+    const testing = std.testing;
+
+// ╚════════════════════════════════════════════════════════════════════════════════╝
+
+// ╔══════════════════════════════════════ CORE ═══════════════════════════════════════╗
+
+    /// Maximum size of a source file the fixer will load.
+    const max_file_size: usize = 16 * 1024 * 1024;
+
+    /// Canonical closing borders, built at comptime.
+    const close_border = "// ╚" ++ ("═" ** 84) ++ "╝";
+    const sub_close_border = "// └" ++ ("─" ** 84) ++ "┘";
+
+    /// Header lines rewritten to the canonical repository URLs.
+    const repo_prefix = "// repo   : ";
+    const repo_line = "// repo   : https://github.com/fisty/zig-nfl-clock";
+    const docs_prefix = "// docs   : https://";
+    const docs_new_prefix = "// docs   : https://fisty.github.io/zig-nfl-clock/";
+
+    /// Special cases for compound words when pascalizing test components.
+    const special_cases = std.StaticStringMap([]const u8).initComptime(.{
+        .{ "game_clock", "GameClock" },
+        .{ "time_formatter", "TimeFormatter" },
+        .{ "rules_engine", "RulesEngine" },
+        .{ "play_handler", "PlayHandler" },
+        .{ "config", "Config" },
+    });
+
+    /// Appends `fill` to `out` `count` times.
+    fn appendRepeat(out: *std.ArrayList(u8), fill: []const u8, count: usize) !void {
+        var i: usize = 0;
+        while (i < count) : (i += 1) {
+            try out.appendSlice(fill);
+        }
+    }
+
+    /// Appends an 88-character border line for `name` to `out`.
+    fn writeBorder(out: *std.ArrayList(u8), open: []const u8, fill: []const u8, name: []const u8, close: []const u8) !void {
+        const base_len = 3 + 1 + name.len + 1 + 2; // "// ", corners, spaces around name
+        const pad_total = 88 - base_len;
+        const pad_left = pad_total / 2;
+
+        try out.appendSlice("// ");
+        try out.appendSlice(open);
+        try appendRepeat(out, fill, pad_left);
+        try out.append(' ');
+        try out.appendSlice(name);
+        try out.append(' ');
+        try appendRepeat(out, fill, pad_total - pad_left);
+        try out.appendSlice(close);
+    }
+
+    /// Extracts the section name from a border body, or null when the body is
+    /// not a well-formed `<fill> NAME <fill>` border.
+    fn borderName(body: []const u8) ?[]const u8 {
+        var it = std.mem.tokenizeScalar(u8, body, ' ');
+        _ = it.next() orelse return null; // leading fill run
+        const name = it.next() orelse return null;
+        if (it.next() == null) return null; // trailing fill run
+        if (it.next() != null) return null;
+
+        if (name.len == 0 or name.len > 80) return null;
+        for (name) |c| {
+            if (!(std.ascii.isAlphanumeric(c) or c == '_')) return null;
+        }
+        return name;
+    }
+
+    /// Rewrites a section border line to exactly 88 characters.
+    ///
+    /// Appends the corrected line to `out` and returns true when the line was
+    /// a border needing correction; appends nothing otherwise.
+    fn fixBorderLine(out: *std.ArrayList(u8), line: []const u8) !bool {
+        const trimmed = std.mem.trimRight(u8, line, " \t");
+        if (!std.mem.startsWith(u8, trimmed, "// ")) return false;
+        const body = trimmed[3..];
+
+        if (std.mem.startsWith(u8, body, "╔") and std.mem.endsWith(u8, body, "╗")) {
+            const name = borderName(body) orelse return false;
+            const start = out.items.len;
+            try writeBorder(out, "╔", "═", name, "╗");
+            if (std.mem.eql(u8, out.items[start..], line)) {
+                out.shrinkRetainingCapacity(start);
+                return false;
+            }
+            return true;
+        }
+
+        if (std.mem.startsWith(u8, body, "╚") and std.mem.endsWith(u8, body, "╝")) {
+            if (std.mem.eql(u8, line, close_border)) return false;
+            try out.appendSlice(close_border);
+            return true;
+        }
+
+        if (std.mem.startsWith(u8, body, "┌") and std.mem.endsWith(u8, body, "┐")) {
+            const name = borderName(body) orelse return false;
+            const start = out.items.len;
+            try writeBorder(out, "┌", "─", name, "┐");
+            if (std.mem.eql(u8, out.items[start..], line)) {
+                out.shrinkRetainingCapacity(start);
+                return false;
+            }
+            return true;
+        }
+
+        if (std.mem.startsWith(u8, body, "└") and std.mem.endsWith(u8, body, "┘")) {
+            if (std.mem.eql(u8, line, sub_close_border)) return false;
+            try out.appendSlice(sub_close_border);
+            return true;
+        }
+
+        return false;
+    }
+
+    /// Rewrites repo/docs header URL lines to the canonical project location.
+    ///
+    /// Appends the corrected line to `out` and returns true when the line was
+    /// a URL header needing correction; appends nothing otherwise.
+    fn fixUrlLine(out: *std.ArrayList(u8), line: []const u8) !bool {
+        if (std.mem.startsWith(u8, line, repo_prefix)) {
+            if (std.mem.eql(u8, line, repo_line)) return false;
+            try out.appendSlice(repo_line);
+            return true;
+        }
+
+        if (std.mem.startsWith(u8, line, docs_prefix)) {
+            if (std.mem.startsWith(u8, line, docs_new_prefix)) return false;
+            const slash = std.mem.indexOfScalarPos(u8, line, docs_prefix.len, '/') orelse return false;
+            try out.appendSlice(docs_new_prefix);
+            try out.appendSlice(line[slash + 1 ..]);
+            return true;
+        }
+
+        return false;
+    }
+
+    /// Returns true when a test component is written in snake_case.
+    fn isSnakeCase(component: []const u8) bool {
+        if (component.len == 0) return false;
+        for (component) |c| {
+            if (!(std.ascii.isLower(c) or c == '_')) return false;
+        }
+        return true;
+    }
+
+    /// Appends the PascalCase form of a snake_case component to `out`.
+    fn appendPascal(out: *std.ArrayList(u8), component: []const u8) !void {
+        if (special_cases.get(component)) |mapped| {
+            try out.appendSlice(mapped);
+            return;
+        }
+
+        var parts = std.mem.splitScalar(u8, component, '_');
+        while (parts.next()) |part| {
+            if (part.len == 0) continue;
+            try out.append(std.ascii.toUpper(part[0]));
+            try out.appendSlice(part[1..]);
+        }
+    }
+
+    /// Rewrites a test declaration: pascalizes a snake_case component and adds
+    /// a missing opening brace.
+    ///
+    /// Appends the corrected line to `out` and returns true when the line was
+    /// a declaration needing correction; appends nothing otherwise.
+    fn fixTestLine(out: *std.ArrayList(u8), line: []const u8) !bool {
+        const content_start = std.mem.indexOfNone(u8, line, " \t") orelse return false;
+        const indent = line[0..content_start];
+        const rest = line[content_start..];
+        if (!std.mem.startsWith(u8, rest, "test \"")) return false;
+
+        const close_quote = std.mem.lastIndexOfScalar(u8, rest, '"') orelse return false;
+        if (close_quote < 6) return false;
+        const inner = rest[6..close_quote];
+        const tail = rest[close_quote + 1 ..];
+
+        const needs_brace = std.mem.trim(u8, tail, " \t").len == 0;
+
+        // Locate a "category: component: description" declaration whose
+        // component is still snake_case.
+        var prefix: []const u8 = undefined;
+        var component: []const u8 = undefined;
+        var suffix: []const u8 = undefined;
+        var needs_rename = false;
+        if (std.mem.indexOf(u8, inner, ": ")) |sep1| {
+            const after = inner[sep1 + 2 ..];
+            if (std.mem.indexOf(u8, after, ": ")) |sep2| {
+                if (isSnakeCase(after[0..sep2])) {
+                    prefix = inner[0 .. sep1 + 2];
+                    component = after[0..sep2];
+                    suffix = after[sep2..];
+                    needs_rename = true;
+                }
+            }
+        }
+
+        if (!needs_brace and !needs_rename) return false;
+
+        try out.appendSlice(indent);
+        try out.appendSlice("test \"");
+        if (needs_rename) {
+            try out.appendSlice(prefix);
+            try appendPascal(out, component);
+            try out.appendSlice(suffix);
+        } else {
+            try out.appendSlice(inner);
+        }
+        try out.append('"');
+        try out.appendSlice(tail);
+        if (needs_brace) try out.appendSlice(" {");
+        return true;
+    }
+
+    /// Applies every fix to a single file, reading and writing it once.
+    ///
+    /// __Parameters__
+    ///
+    /// - `allocator`: Memory allocator for the file content and output buffer
+    /// - `path`: Path of the .zig file to process
+    ///
+    /// __Return__
+    ///
+    /// - true when the file was rewritten
+    fn processFile(allocator: std.mem.Allocator, path: []const u8) !bool {
+        const content = blk: {
+            const file = try std.fs.cwd().openFile(path, .{});
+            defer file.close();
+            break :blk try file.readToEndAlloc(allocator, max_file_size);
+        };
+        defer allocator.free(content);
+
+        var out = std.ArrayList(u8).init(allocator);
+        defer out.deinit();
+        try out.ensureTotalCapacity(content.len + 64);
+
+        var changed = false;
+        var first = true;
+        var it = std.mem.splitScalar(u8, content, '\n');
+        while (it.next()) |line| {
+            if (!first) try out.append('\n');
+            first = false;
+            if (try fixBorderLine(&out, line)) {
+                changed = true;
+                continue;
+            }
+            if (try fixUrlLine(&out, line)) {
+                changed = true;
+                continue;
+            }
+            if (try fixTestLine(&out, line)) {
+                changed = true;
+                continue;
+            }
+            try out.appendSlice(line);
+        }
+
+        if (!changed) return false;
+
+        const out_file = try std.fs.cwd().createFile(path, .{ .truncate = true });
+        defer out_file.close();
+        try out_file.writeAll(out.items);
+        return true;
+    }
+
+    /// Thread-pool task wrapper around processFile.
+    fn processFileTask(allocator: std.mem.Allocator, path: []const u8, modified: *std.atomic.Value(usize)) void {
+        const changed = processFile(allocator, path) catch |err| {
+            std.debug.print("✗ Error processing {s}: {}\n", .{ path, err });
+            return;
+        };
+        if (changed) {
+            _ = modified.fetchAdd(1, .monotonic);
+            std.debug.print("✓ Fixed: {s}\n", .{path});
+        }
+    }
+
+    /// Collects every .zig file under `root_path`, skipping build directories.
+    fn collectZigFiles(allocator: std.mem.Allocator, root_path: []const u8, files: *std.ArrayList([]u8)) !void {
+        var dir = try std.fs.cwd().openDir(root_path, .{ .iterate = true });
+        defer dir.close();
+
+        var walker = try dir.walk(allocator);
+        defer walker.deinit();
+
+        while (try walker.next()) |entry| {
+            if (entry.kind != .file) continue;
+            if (!std.mem.endsWith(u8, entry.basename, ".zig")) continue;
+            if (std.mem.indexOf(u8, entry.path, ".zig-cache") != null) continue;
+            if (std.mem.indexOf(u8, entry.path, "zig-out") != null) continue;
+
+            const full = try std.fs.path.join(allocator, &.{ root_path, entry.path });
+            try files.append(full);
+        }
+    }
+
+    /// Entry point: fixes every .zig file under the given root (default ".")
+    /// using one worker per core.
+    pub fn main() !void {
+        var gpa = std.heap.GeneralPurposeAllocator(.{}){};
+        defer _ = gpa.deinit();
+        const allocator = gpa.allocator();
+
+        var args = try std.process.argsWithAllocator(allocator);
+        defer args.deinit();
+        _ = args.next(); // program name
+        const root = args.next() orelse ".";
+
+        var files = std.ArrayList([]u8).init(allocator);
+        defer {
+            for (files.items) |p| allocator.free(p);
+            files.deinit();
+        }
+        try collectZigFiles(allocator, root, &files);
+
+        std.debug.print("Found {d} .zig files to process\n", .{files.items.len});
+
+        var modified = std.atomic.Value(usize).init(0);
+        var pool: std.Thread.Pool = undefined;
+        try pool.init(.{ .allocator = allocator });
+        defer pool.deinit();
+
+        var wait_group: std.Thread.WaitGroup = .{};
+        for (files.items) |path| {
+            pool.spawnWg(&wait_group, processFileTask, .{ allocator, path, &modified });
+        }
+        pool.waitAndWork(&wait_group);
+
+        std.debug.print("Summary: Fixed {d}/{d} files\n", .{ modified.load(.monotonic), files.items.len });
+    }
+
+// ╚════════════════════════════════════════════════════════════════════════════════╝
+
+// ╔══════════════════════════════════════ TEST ═══════════════════════════════════════╗
+
+    test "unit: McsFix: pascalizes snake_case components" {
+        var out = std.ArrayList(u8).init(testing.allocator);
+        defer out.deinit();
+
+        try appendPascal(&out, "game_clock");
+        try testing.expectEqualStrings("GameClock", out.items);
+
+        out.clearRetainingCapacity();
+        try appendPascal(&out, "two_minute_warning");
+        try testing.expectEqualStrings("TwoMinuteWarning", out.items);
+    }
+
+    test "unit: McsFix: normalizes section borders to 88 characters" {
+        var out = std.ArrayList(u8).init(testing.allocator);
+        defer out.deinit();
+
+        const changed = try fixBorderLine(&out, "// ╔══ PACK ══╗");
+        try testing.expect(changed);
+        try testing.expectEqual(@as(usize, 88), try std.unicode.utf8CountCodepoints(out.items));
+    }
+
+    test "unit: McsFix: leaves well-formed borders untouched" {
+        var out = std.ArrayList(u8).init(testing.allocator);
+        defer out.deinit();
+
+        var canonical = std.ArrayList(u8).init(testing.allocator);
+        defer canonical.deinit();
+        try writeBorder(&canonical, "╔", "═", "PACK", "╗");
+
+        const changed = try fixBorderLine(&out, canonical.items);
+        try testing.expect(!changed);
+        try testing.expectEqual(@as(usize, 0), out.items.len);
+    }
+
+    test "unit: McsFix: rewrites repo and docs header URLs" {
+        var out = std.ArrayList(u8).init(testing.allocator);
+        defer out.deinit();
+
+        try testing.expect(try fixUrlLine(&out, "// repo   : https://github.com/zig-nfl-clock"));
+        try testing.expectEqualStrings(repo_line, out.items);
+
+        out.clearRetainingCapacity();
+        try testing.expect(try fixUrlLine(&out, "// docs   : https://zig-nfl-clock.github.io/docs/lib/game_clock"));
+        try testing.expectEqualStrings("// docs   : https://fisty.github.io/zig-nfl-clock/docs/lib/game_clock", out.items);
+
+        out.clearRetainingCapacity();
+        try testing.expect(!try fixUrlLine(&out, repo_line));
+    }
+
+    test "unit: McsFix: adds missing test braces and renames components" {
+        var out = std.ArrayList(u8).init(testing.allocator);
+        defer out.deinit();
+
+        try testing.expect(try fixTestLine(&out, "test \"unit: game_clock: starts\""));
+        try testing.expectEqualStrings("test \"unit: GameClock: starts\" {", out.items);
+
+        out.clearRetainingCapacity();
+        try testing.expect(!try fixTestLine(&out, "test \"unit: GameClock: starts\" {"));
+    }
+
+// ╚════════════════════════════════════════════════════════════════════════════════╝